@@ -0,0 +1,257 @@
+# Copyright (c) 2023 Boston Dynamics, Inc.  All rights reserved.
+#
+# Downloading, reproducing, distributing or otherwise using the SDK Software
+# is subject to the terms and conditions of the Boston Dynamics Software
+# Development Kit License (20191101-BDSDK-SL).
+
+"""GUI for editing the actions and playback settings of an Autowalk mission."""
+
+import PyQt5.QtCore as QtCore
+import PyQt5.QtWidgets as QtWidgets
+
+from bosdyn.api.autowalk import walks_pb2
+
+
+class ListWidget(QtWidgets.QListWidget):
+    """List object for GUI"""
+
+    def __init__(self, type, parent=None, isMutable=False):
+        super(ListWidget, self).__init__(parent)
+        self.setIconSize(QtCore.QSize(124, 124))
+        self.setDragDropMode(QtWidgets.QAbstractItemView.DragDrop)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.setAcceptDrops(isMutable)
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.accept()
+        else:
+            super(ListWidget, self).dragEnterEvent(event)
+
+    def dragMoveEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.setDropAction(QtCore.Qt.CopyAction)
+            event.accept()
+        else:
+            super(ListWidget, self).dragMoveEvent(event)
+
+    def dropEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.setDropAction(QtCore.Qt.CopyAction)
+            event.accept()
+            links = []
+            for url in event.mimeData().urls():
+                links.append(str(url.toLocalFile()))
+            self.emit(QtCore.SIGNAL('dropped'), links)
+        else:
+            event.setDropAction(QtCore.Qt.MoveAction)
+            super(ListWidget, self).dropEvent(event)
+
+
+class AutowalkGUI(QtWidgets.QMainWindow):
+    """GUI for editing autowalk"""
+
+    def __init__(self, walk):
+        super(QtWidgets.QMainWindow, self).__init__()
+        self.walk = walk
+        self.walk_name_to_index = {
+            element.name: index for index, element in enumerate(walk.elements)
+        }
+
+        # Create and format GUI window
+        myQWidget = QtWidgets.QWidget()
+        myOuterBoxLayout = QtWidgets.QVBoxLayout()
+        myQWidget.setLayout(myOuterBoxLayout)
+        self.setCentralWidget(myQWidget)
+
+        mediumWidget = QtWidgets.QWidget()
+        myMediumBoxLayout = QtWidgets.QHBoxLayout()
+        mediumWidget.setLayout(myMediumBoxLayout)
+
+        # List widget with available autowalk actions
+        self.sourceLabelWidget = QtWidgets.QLabel(self)
+        self.sourceLabelWidget.setText('Available Actions')
+        self.sourceLabelWidget.setAlignment(QtCore.Qt.AlignCenter)
+        self.sourceListWidget = ListWidget(self)
+
+        self.copyAllButton = QtWidgets.QPushButton('Copy All', self)
+
+        # Populates with current actions from autowalk file
+        for element in walk.elements:
+            QtWidgets.QListWidgetItem(element.name, self.sourceListWidget)
+
+        sourceWidget = QtWidgets.QWidget()
+        sourceBoxLayout = QtWidgets.QVBoxLayout()
+        sourceWidget.setLayout(sourceBoxLayout)
+        sourceBoxLayout.addWidget(self.sourceLabelWidget)
+        sourceBoxLayout.addWidget(self.sourceListWidget)
+        sourceBoxLayout.addWidget(self.copyAllButton)
+
+        myMediumBoxLayout.addWidget(sourceWidget)
+
+        # List widget with modified autowalk
+        self.actionLabelWidget = QtWidgets.QLabel(self)
+        self.actionLabelWidget.setText('Current Autowalk')
+        self.actionLabelWidget.setAlignment(QtCore.Qt.AlignCenter)
+        self.actionListWidget = ListWidget(self, isMutable=True)
+
+        actionWidget = QtWidgets.QWidget()
+        actionBoxLayout = QtWidgets.QVBoxLayout()
+        actionWidget.setLayout(actionBoxLayout)
+        self.deleteButton = QtWidgets.QPushButton('Delete Selected', self)
+        actionBoxLayout.addWidget(self.actionLabelWidget)
+        actionBoxLayout.addWidget(self.actionListWidget)
+        actionBoxLayout.addWidget(self.deleteButton)
+        myMediumBoxLayout.addWidget(actionWidget)
+
+        # Layout for settings
+        self.settingsWidget = QtWidgets.QWidget()
+        self.settingsBoxLayout = QtWidgets.QVBoxLayout()
+        self.settingsWidget.setLayout(self.settingsBoxLayout)
+        self.settingsBoxLayout.setAlignment(QtCore.Qt.AlignTop)
+
+        self.settingsLabelWidget = QtWidgets.QLabel(self)
+        self.settingsLabelWidget.setText('Play Autowalk')
+        self.settingsLabelWidget.setAlignment(QtCore.Qt.AlignCenter)
+        self.repeatsComboBox = QtWidgets.QComboBox(self)
+        self.repeatsComboBox.addItems(['Once', 'Periodically', 'Continuously'])
+        self.skipDockingBox = QtWidgets.QCheckBox('Skip docking')
+        self.intervalLabel = None
+        self.intervalLine = None
+        self.repeatLabel = None
+        self.repeatLine = None
+
+        self.settingsBoxLayout.addWidget(self.settingsLabelWidget)
+        self.settingsBoxLayout.addWidget(self.repeatsComboBox)
+        self.settingsBoxLayout.addWidget(self.skipDockingBox)
+
+        myMediumBoxLayout.addWidget(self.settingsWidget)
+
+        myOuterBoxLayout.addWidget(mediumWidget)
+
+        # Widget for buttons
+        self.applyButton = QtWidgets.QPushButton('Apply', self)
+        self.cancelButton = QtWidgets.QPushButton('Cancel', self)
+        buttonWidget = QtWidgets.QWidget()
+        buttonBoxLayout = QtWidgets.QHBoxLayout()
+        buttonWidget.setLayout(buttonBoxLayout)
+        buttonBoxLayout.addWidget(self.cancelButton)
+        buttonBoxLayout.addWidget(self.applyButton)
+        myOuterBoxLayout.addWidget(buttonWidget)
+
+        # Signal handling
+        self.repeatsComboBox.activated.connect(self.change_play_window)
+        self.copyAllButton.clicked.connect(self.copy_all)
+        self.deleteButton.clicked.connect(self.delete_action)
+        self.applyButton.clicked.connect(self.apply_changes)
+        self.cancelButton.clicked.connect(self.cancel_application)
+
+        self.setWindowTitle('Drag and Drop Autowalk')
+
+    def cancel_application(self):
+        """Clears walk by modifying protocol buffer object"""
+        del self.walk.elements[:]
+        self.walk_name_to_index = None
+        self.close()
+
+    def copy_all(self):
+        """Copies all actions to current autowalk list"""
+        self.actionListWidget.clear()
+        for element in self.walk.elements:
+            QtWidgets.QListWidgetItem(element.name, self.actionListWidget)
+
+    def delete_action(self):
+        """Removes selected action from current autowalk list"""
+        selectedItems = self.actionListWidget.selectedItems()
+        for item in selectedItems:
+            row = self.actionListWidget.row(item)
+            self.actionListWidget.takeItem(row)
+
+    def apply_changes(self):
+        """Modifies walk according to final autowalk list"""
+
+        # Maps list of action names to element protocol objects
+        action_list = self.actionListWidget
+        name_to_index = self.walk_name_to_index
+        walk_elements = self.walk.elements
+        elements = [
+            walk_elements[name_to_index[action_list.item(row).text()]]
+            for row in range(action_list.count())
+        ]
+
+        # Builds the new elements in a separate walk, then swaps them into the current walk at once
+        new_walk = walks_pb2.Walk()
+        new_walk.elements.extend(elements)
+        self.walk.ClearField('elements')
+        self.walk.MergeFrom(new_walk)
+
+        # If "once" is selected, check if docking should be skipped
+        if self.repeatsComboBox.currentIndex() == 0:
+            self.walk.playback_mode.once.skip_docking_after_completion = self.skipDockingBox.isChecked(
+            )
+        # If "periodically" is selected, set the interval and repetitions that were input
+        elif self.repeatsComboBox.currentIndex() == 1:
+            intervalInput = int(self.intervalLine.text().strip())
+            repeatInput = int(self.repeatLine.text().strip())
+            self.walk.playback_mode.periodic.interval.seconds = intervalInput
+            self.walk.playback_mode.periodic.repetitions = repeatInput
+        # If "continuous" is selected
+        else:
+            self.walk.playback_mode.continuous.SetInParent()
+
+        # The lookup table is only needed while editing
+        self.walk_name_to_index = None
+        self.close()
+
+    def change_play_window(self, index):
+        """Changes the panel for repetitions of autowalk"""
+        # 'Once' is selected
+        if index == 0:
+            # Clears interval GUI options
+            self._clear_interval_widgets()
+
+            # Adds docking box to GUI
+            if not self.skipDockingBox:
+                self.skipDockingBox = QtWidgets.QCheckBox('Skip docking')
+                self.settingsBoxLayout.addWidget(self.skipDockingBox)
+
+        # 'Periodically' is selected
+        elif index == 1:
+            # Removes docking box
+            self._clear_docking_box()
+
+            # Adds interval and repetition input boxes if needed
+            if not self.intervalLabel:
+                self.intervalLabel = QtWidgets.QLabel(self)
+                self.intervalLabel.setText('Time Interval (s):')
+                self.intervalLine = QtWidgets.QLineEdit()
+                self.repeatLabel = QtWidgets.QLabel(self)
+                self.repeatLabel.setText('Repetitions:')
+                self.repeatLine = QtWidgets.QLineEdit()
+
+                self.settingsBoxLayout.addWidget(self.intervalLabel)
+                self.settingsBoxLayout.addWidget(self.intervalLine)
+                self.settingsBoxLayout.addWidget(self.repeatLabel)
+                self.settingsBoxLayout.addWidget(self.repeatLine)
+
+        # 'Continuously' is selected
+        else:
+            # Removes all other GUI inputs if necessary
+            self._clear_interval_widgets()
+            self._clear_docking_box()
+
+    def _clear_interval_widgets(self):
+        """Removes the interval and repetition inputs from the settings panel"""
+        for attribute in ('intervalLabel', 'intervalLine', 'repeatLabel', 'repeatLine'):
+            widget = getattr(self, attribute)
+            if widget:
+                self.settingsBoxLayout.removeWidget(widget)
+                widget.deleteLater()
+                setattr(self, attribute, None)
+
+    def _clear_docking_box(self):
+        """Removes the skip docking checkbox from the settings panel"""
+        if self.skipDockingBox:
+            self.settingsBoxLayout.removeWidget(self.skipDockingBox)
+            self.skipDockingBox.deleteLater()
+            self.skipDockingBox = None
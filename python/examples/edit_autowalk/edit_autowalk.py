@@ -9,20 +9,24 @@ Autowalk Replay Script.  Command-line utility to edit and replay stored Autowalk
 """
 
 import argparse
+import concurrent.futures
+import gc
+import hashlib
+import mmap
 import os
+import pathlib
+import shelve
 import sys
 import time
 
-import PyQt5.QtCore as QtCore
-import PyQt5.QtWidgets as QtWidgets
+from google.protobuf.internal import api_implementation
 
-import bosdyn.api.mission
 import bosdyn.client
+import bosdyn.client.autowalk
+import bosdyn.client.graph_nav
 import bosdyn.client.lease
 import bosdyn.client.util
-import bosdyn.geometry
 import bosdyn.mission.client
-import bosdyn.util
 from bosdyn.api.autowalk import autowalk_pb2, walks_pb2
 from bosdyn.api.graph_nav import graph_nav_pb2, map_pb2, nav_pb2
 from bosdyn.api.mission import mission_pb2
@@ -30,6 +34,23 @@ from bosdyn.client.power import PowerClient, power_on_motors
 from bosdyn.client.robot_command import RobotCommandClient, blocking_stand
 from bosdyn.client.robot_state import RobotStateClient
 
+# Number of snapshots read from disk and uploaded to the robot in parallel.
+SNAPSHOT_UPLOAD_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+# Snapshot files smaller than this (bytes) are read directly instead of being memory-mapped.
+SNAPSHOT_MMAP_MIN_SIZE = 64 * 1024
+
+# Bounds (s) on the interval between mission state polls while an autowalk is running.
+MIN_MISSION_POLL_INTERVAL = 0.1
+MAX_MISSION_POLL_INTERVAL = 1.0
+
+# Longest interval (s) between play requests. Play is also re-sent at least twice per mission timeout.
+MAX_PLAY_REQUEST_PERIOD = 1.0
+
+# Directory holding data cached between runs of this script.
+CACHE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'bosdyn')
+AUTOWALK_EDIT_CACHE = os.path.join(CACHE_DIRECTORY, 'autowalk_edits')
+
 
 def main():
     """Edit and replay stored autowalks with command-line interface"""
@@ -60,6 +81,19 @@ def main():
         '--walk_filename', dest='walk_filename', required=True, help=
         'Autowalk mission filename. Script assumes the path to this file is [walk_directory]/missions/[walk_filename]'
     )
+    parser.add_argument(
+        '--use_cached_edit', action='store_true', default=False, dest='use_cached_edit',
+        help='Skip the editing GUI and reuse the last edit saved with this option for the autowalk '
+        'file, as long as the file has not changed since')
+    parser.add_argument(
+        '--skip_unchanged_upload', action='store_true', default=False, dest='skip_unchanged_upload',
+        help=
+        'Skip uploading the autowalk if it is identical to the last one this script uploaded to the robot, '
+        'and restart the mission already loaded on the robot instead. Only use this if no other mission '
+        'has been loaded on the robot since.')
+    parser.add_argument(
+        '--stabilization_seconds', type=float, default=5.0, dest='stabilization_seconds', help=
+        'Time (s) to wait after standing for the perception system to stabilize. 0 skips the wait.')
 
     args = parser.parse_args()
 
@@ -75,6 +109,11 @@ def main():
     # Initialize robot object
     robot = init_robot(args.hostname)
 
+    # Large walks and maps parse an order of magnitude slower without a native protobuf backend.
+    if api_implementation.Type() == 'python':
+        robot.logger.warning('Using the pure-Python protobuf implementation. Install protobuf '
+                             '>= 4.21 to load walks and maps faster.')
+
     if not os.path.isfile(autowalk_file):
         robot.logger.fatal('Unable to find autowalk file: %s.', autowalk_file)
         sys.exit(1)
@@ -83,8 +122,19 @@ def main():
         robot.logger.fatal('Unable to find walk directory: %s.', walk_directory)
         sys.exit(1)
 
-    # Open GUI to edit autowalk
-    walk = create_and_edit_autowalk(autowalk_file, robot.logger)
+    # Open GUI to edit autowalk, unless an edit of this exact file was saved by a previous run
+    walk = None
+    if args.use_cached_edit:
+        file_digest = autowalk_file_digest(autowalk_file)
+        walk = load_autowalk_edit(autowalk_file, file_digest)
+        if walk is None:
+            robot.logger.info('No cached edit found for %s.', autowalk_file)
+        else:
+            robot.logger.info('Using cached edit of %s.', autowalk_file)
+    if walk is None:
+        walk = create_and_edit_autowalk(autowalk_file, robot.logger)
+        if args.use_cached_edit:
+            save_autowalk_edit(autowalk_file, file_digest, walk)
 
     assert not robot.is_estopped(), 'Robot is estopped. Please use an external E-Stop client, such as the estop SDK ' \
                                     'example, to configure E-Stop.'
@@ -98,8 +148,13 @@ def main():
     lease_client = robot.ensure_client(bosdyn.client.lease.LeaseClient.default_service_name)
 
     with bosdyn.client.lease.LeaseKeepAlive(lease_client, must_acquire=True, return_at_exit=True):
-        # Upload autowalk mission to robot
-        upload_autowalk(robot.logger, autowalk_client, walk)
+        # Upload autowalk mission to robot, unless the robot already has this exact walk loaded
+        hostname = args.hostname if args.skip_unchanged_upload else None
+        skip_upload = hostname is not None and is_last_uploaded_autowalk(walk, hostname)
+        if skip_upload:
+            robot.logger.info('Autowalk is unchanged since the last upload, skipping upload')
+        else:
+            upload_autowalk(robot.logger, autowalk_client, walk, hostname=hostname)
 
         # Turn on power
         power_on_motors(power_client)
@@ -107,7 +162,8 @@ def main():
         # Stand up and wait for the perception system to stabilize
         robot.logger.info('Commanding robot to stand...')
         blocking_stand(command_client, timeout_sec=20)
-        countdown(5)
+        if args.stabilization_seconds > 0:
+            countdown(args.stabilization_seconds)
         robot.logger.info('Robot standing.')
 
         # Localize robot
@@ -126,7 +182,7 @@ def main():
         # Run autowalk
         if not args.static_mode:
             run_autowalk(robot.logger, mission_client, fail_on_question, args.timeout,
-                         path_following_mode)
+                         path_following_mode, restart=skip_upload)
 
 
 def init_robot(hostname):
@@ -186,9 +242,11 @@ def init_clients(robot, walk_directory):
 
 
 def countdown(length):
-    """Print sleep countdown"""
+    """Print sleep countdown. Length may be fractional; the fraction is slept first."""
 
-    for i in range(length, 0, -1):
+    whole_seconds = int(length)
+    time.sleep(length - whole_seconds)
+    for i in range(whole_seconds, 0, -1):
         print(i, end=' ', flush=True)
         time.sleep(1)
     print(0)
@@ -197,11 +255,13 @@ def countdown(length):
 def create_and_edit_autowalk(filename, logger):
     """Creates autowalk from file and opens GUI for editing"""
 
-    walk = walks_pb2.Walk()
+    # PyQt5 is slow to import, so it is only loaded once the GUI is needed.
+    import PyQt5.QtCore as QtCore
+    import PyQt5.QtWidgets as QtWidgets
+    from autowalk_gui import AutowalkGUI
 
-    with open(filename, 'rb') as autowalk_file:
-        data = autowalk_file.read()
-        walk.ParseFromString(data)
+    walk = walks_pb2.Walk()
+    walk.ParseFromString(pathlib.Path(filename).read_bytes())
 
     app = QtWidgets.QApplication(sys.argv)
     gui = AutowalkGUI(walk)
@@ -210,6 +270,10 @@ def create_and_edit_autowalk(filename, logger):
     gui.resize(540, 320)
     app.exec_()
 
+    # Release the GUI and any elements it dropped before the upload starts
+    del gui
+    gc.collect()
+
     if not walk.elements:
         logger.fatal('Autowalk cancelled due to empty walk or user input')
         sys.exit(1)
@@ -217,6 +281,38 @@ def create_and_edit_autowalk(filename, logger):
     return walk
 
 
+def autowalk_file_digest(filename):
+    """Returns a digest identifying the contents of an autowalk file"""
+
+    return hashlib.sha256(pathlib.Path(filename).read_bytes()).hexdigest()
+
+
+def load_autowalk_edit(filename, file_digest):
+    """Returns the edited walk saved for the autowalk file, or None if there is none or the file
+    has changed since the edit was saved"""
+
+    os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+    with shelve.open(AUTOWALK_EDIT_CACHE) as cache:
+        saved_digest, data = cache.get(os.path.abspath(filename), (None, None))
+    if saved_digest != file_digest:
+        return None
+
+    walk = walks_pb2.Walk()
+    walk.ParseFromString(data)
+    return walk
+
+
+def save_autowalk_edit(filename, file_digest, walk):
+    """Saves the edited walk so later runs can replay it without editing again.
+
+    Only the latest edit of each autowalk file is kept.
+    """
+
+    os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+    with shelve.open(AUTOWALK_EDIT_CACHE) as cache:
+        cache[os.path.abspath(filename)] = (file_digest, walk.SerializeToString())
+
+
 def upload_graph_and_snapshots(logger, client, path):
     """Upload the graph and snapshots to the robot"""
 
@@ -224,38 +320,10 @@ def upload_graph_and_snapshots(logger, client, path):
     graph_filename = os.path.join(path, 'graph')
     logger.info('Loading graph from %s', graph_filename)
 
-    with open(graph_filename, 'rb') as graph_file:
-        data = graph_file.read()
-        current_graph = map_pb2.Graph()
-        current_graph.ParseFromString(data)
-        logger.info('Loaded graph has %d waypoints and %d edges', len(current_graph.waypoints),
-                    len(current_graph.edges))
-
-    # Load the waypoint snapshots from disk.
-    current_waypoint_snapshots = dict()
-    for waypoint in current_graph.waypoints:
-        if len(waypoint.snapshot_id) == 0:
-            continue
-        snapshot_filename = os.path.join(path, 'waypoint_snapshots', waypoint.snapshot_id)
-        logger.info('Loading waypoint snapshot from %s', snapshot_filename)
-
-        with open(snapshot_filename, 'rb') as snapshot_file:
-            waypoint_snapshot = map_pb2.WaypointSnapshot()
-            waypoint_snapshot.ParseFromString(snapshot_file.read())
-            current_waypoint_snapshots[waypoint_snapshot.id] = waypoint_snapshot
-
-    # Load the edge snapshots from disk.
-    current_edge_snapshots = dict()
-    for edge in current_graph.edges:
-        if len(edge.snapshot_id) == 0:
-            continue
-        snapshot_filename = os.path.join(path, 'edge_snapshots', edge.snapshot_id)
-        logger.info('Loading edge snapshot from %s', snapshot_filename)
-
-        with open(snapshot_filename, 'rb') as snapshot_file:
-            edge_snapshot = map_pb2.EdgeSnapshot()
-            edge_snapshot.ParseFromString(snapshot_file.read())
-            current_edge_snapshots[edge_snapshot.id] = edge_snapshot
+    current_graph = map_pb2.Graph()
+    current_graph.ParseFromString(pathlib.Path(graph_filename).read_bytes())
+    logger.info('Loaded graph has %d waypoints and %d edges', len(current_graph.waypoints),
+                len(current_graph.edges))
 
     # Upload the graph to the robot.
     logger.info('Uploading the graph and snapshots to the robot...')
@@ -263,33 +331,137 @@ def upload_graph_and_snapshots(logger, client, path):
     response = client.upload_graph(graph=current_graph, generate_new_anchoring=no_anchors)
     logger.info('Uploaded graph.')
 
-    # Upload the snapshots to the robot.
-    for snapshot_id in response.unknown_waypoint_snapshot_ids:
-        waypoint_snapshot = current_waypoint_snapshots[snapshot_id]
-        client.upload_waypoint_snapshot(waypoint_snapshot=waypoint_snapshot)
-        logger.info('Uploaded %s', waypoint_snapshot.id)
+    # Upload the snapshots the robot does not already have, several at a time. Snapshots
+    # are only read from disk once the robot has asked for them. Waypoint and edge snapshots
+    # share the pool so that edge uploads start as soon as a worker is free.
+    waypoint_snapshot_prefix = os.path.join(path, 'waypoint_snapshots') + os.sep
+    edge_snapshot_prefix = os.path.join(path, 'edge_snapshots') + os.sep
+    with concurrent.futures.ThreadPoolExecutor(max_workers=SNAPSHOT_UPLOAD_WORKERS) as executor:
+        uploads = [
+            executor.submit(upload_waypoint_snapshot, logger, client,
+                            waypoint_snapshot_prefix + snapshot_id)
+            for snapshot_id in response.unknown_waypoint_snapshot_ids
+        ]
+        uploads += [
+            executor.submit(upload_edge_snapshot, logger, client,
+                            edge_snapshot_prefix + snapshot_id)
+            for snapshot_id in response.unknown_edge_snapshot_ids
+        ]
+        try:
+            for upload in concurrent.futures.as_completed(uploads):
+                upload.result()
+        except Exception:
+            # Fail fast: drop the uploads that have not started rather than waiting for them
+            # when the executor exits.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def upload_waypoint_snapshot(logger, client, snapshot_filename):
+    """Load a waypoint snapshot from disk and upload it to the robot"""
+
+    logger.info('Loading waypoint snapshot from %s', snapshot_filename)
+    waypoint_snapshot = map_pb2.WaypointSnapshot()
+    parse_snapshot(waypoint_snapshot, snapshot_filename)
+
+    client.upload_waypoint_snapshot(waypoint_snapshot=waypoint_snapshot)
+    logger.info('Uploaded %s', waypoint_snapshot.id)
+
+
+def upload_edge_snapshot(logger, client, snapshot_filename):
+    """Load an edge snapshot from disk and upload it to the robot"""
 
-    for snapshot_id in response.unknown_edge_snapshot_ids:
-        edge_snapshot = current_edge_snapshots[snapshot_id]
-        client.upload_edge_snapshot(edge_snapshot=edge_snapshot)
-        logger.info('Uploaded %s', edge_snapshot.id)
+    logger.info('Loading edge snapshot from %s', snapshot_filename)
+    edge_snapshot = map_pb2.EdgeSnapshot()
+    parse_snapshot(edge_snapshot, snapshot_filename)
 
+    client.upload_edge_snapshot(edge_snapshot=edge_snapshot)
+    logger.info('Uploaded %s', edge_snapshot.id)
 
-def upload_autowalk(logger, autowalk_client, walk):
-    """Upload the autowalk mission to the robot"""
+
+def parse_snapshot(snapshot, snapshot_filename):
+    """Parse a snapshot protobuf from its file.
+
+    Large snapshots are parsed directly from the memory-mapped file. Small ones, for which mapping
+    costs more than it saves, are read with a single unbuffered read.
+    """
+
+    with open(snapshot_filename, 'rb', buffering=0) as snapshot_file:
+        if os.fstat(snapshot_file.fileno()).st_size < SNAPSHOT_MMAP_MIN_SIZE:
+            snapshot.ParseFromString(snapshot_file.read())
+            return
+        with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as snapshot_data:
+            with memoryview(snapshot_data) as snapshot_view:
+                snapshot.ParseFromString(snapshot_view)
+
+
+def autowalk_digest(walk):
+    """Returns a digest identifying the contents of a walk"""
+
+    return hashlib.sha256(walk.SerializeToString(deterministic=True)).hexdigest()
+
+
+def last_uploaded_autowalk_filename(hostname):
+    """Returns the file holding the digest of the last walk uploaded to the robot"""
+
+    return os.path.join(CACHE_DIRECTORY, f'last_walk_{hostname}')
+
+
+def is_last_uploaded_autowalk(walk, hostname):
+    """Returns True if the walk is identical to the last walk uploaded to the robot by this script"""
+
+    try:
+        last_digest = pathlib.Path(last_uploaded_autowalk_filename(hostname)).read_text()
+    except FileNotFoundError:
+        return False
+    return autowalk_digest(walk) == last_digest
+
+
+def upload_autowalk(logger, autowalk_client, walk, hostname=None):
+    """Upload the autowalk mission to the robot.
+
+    If a hostname is given, the digest of the walk is recorded so that later runs can tell whether
+    the robot already has this walk loaded.
+    """
 
     logger.info('Uploading the autowalk to the robot...')
     autowalk_result = autowalk_client.load_autowalk(walk)
 
     logger.info('Autowalk upload succeeded')
-    return autowalk_result.status == autowalk_pb2.LoadAutowalkResponse.STATUS_OK
+    success = autowalk_result.status == autowalk_pb2.LoadAutowalkResponse.STATUS_OK
+    if hostname and success:
+        # Write the digest to a temporary file first so that an interrupted write cannot leave
+        # a partial digest behind.
+        digest_filename = last_uploaded_autowalk_filename(hostname)
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        pathlib.Path(digest_filename + '.tmp').write_text(autowalk_digest(walk))
+        os.replace(digest_filename + '.tmp', digest_filename)
+    return success
+
 
+def run_autowalk(logger, mission_client, fail_on_question, mission_timeout, path_following_mode,
+                 restart=False):
+    """Run autowalk.
 
-def run_autowalk(logger, mission_client, fail_on_question, mission_timeout, path_following_mode):
-    """Run autowalk"""
+    If restart is True, the mission already loaded on the robot is restarted from the beginning,
+    since a mission that has finished will not play again.
+    """
 
     logger.info('Running autowalk')
 
+    play_settings = mission_pb2.PlaySettings(path_following_mode=path_following_mode)
+    poll_interval = MIN_MISSION_POLL_INTERVAL
+
+    # Keep re-sending play on a fixed period, independent of how often the state is polled, so that
+    # a slow or dropped request leaves most of the timeout for the next one to reach the robot.
+    play_request_period = min(MAX_PLAY_REQUEST_PERIOD, mission_timeout / 2)
+    next_play_time = 0
+
+    if restart:
+        now = time.time()
+        mission_client.restart_mission(now + mission_timeout, settings=play_settings)
+        next_play_time = now + play_request_period
+
     mission_state = mission_client.get_state()
 
     while mission_state.status in (mission_pb2.State.STATUS_NONE, mission_pb2.State.STATUS_RUNNING):
@@ -300,14 +472,21 @@ def run_autowalk(logger, mission_client, fail_on_question, mission_timeout, path
                         mission_state.questions)
             return False
 
-        local_pause_time = time.time() + mission_timeout
-
-        play_settings = mission_pb2.PlaySettings(path_following_mode=path_following_mode)
+        now = time.time()
+        if now >= next_play_time:
+            mission_client.play_mission(now + mission_timeout, settings=play_settings)
+            next_play_time = now + play_request_period
 
-        mission_client.play_mission(local_pause_time, settings=play_settings)
-        time.sleep(1)
+        # Wake up for whichever comes first, the next state poll or the next play request
+        time.sleep(max(0, min(poll_interval, next_play_time - time.time())))
 
+        # Poll quickly after the mission status changes, then back off while it stays the same
+        previous_status = mission_state.status
         mission_state = mission_client.get_state()
+        if mission_state.status == previous_status:
+            poll_interval = min(poll_interval * 1.3, MAX_MISSION_POLL_INTERVAL)
+        else:
+            poll_interval = MIN_MISSION_POLL_INTERVAL
 
     logger.info('Mission status = %s', mission_state.Status.Name(mission_state.status))
 
@@ -315,256 +494,5 @@ def run_autowalk(logger, mission_client, fail_on_question, mission_timeout, path
                                     mission_pb2.State.STATUS_PAUSED)
 
 
-class ListWidget(QtWidgets.QListWidget):
-    """List object for GUI"""
-
-    def __init__(self, type, parent=None, isMutable=False):
-        super(ListWidget, self).__init__(parent)
-        self.setIconSize(QtCore.QSize(124, 124))
-        self.setDragDropMode(QtWidgets.QAbstractItemView.DragDrop)
-        self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
-        self.setAcceptDrops(isMutable)
-
-    def dragEnterEvent(self, event):
-        if event.mimeData().hasUrls():
-            event.accept()
-        else:
-            super(ListWidget, self).dragEnterEvent(event)
-
-    def dragMoveEvent(self, event):
-        if event.mimeData().hasUrls():
-            event.setDropAction(QtCore.Qt.CopyAction)
-            event.accept()
-        else:
-            super(ListWidget, self).dragMoveEvent(event)
-
-    def dropEvent(self, event):
-        if event.mimeData().hasUrls():
-            event.setDropAction(QtCore.Qt.CopyAction)
-            event.accept()
-            links = []
-            for url in event.mimeData().urls():
-                links.append(str(url.toLocalFile()))
-            self.emit(QtCore.SIGNAL('dropped'), links)
-        else:
-            event.setDropAction(QtCore.Qt.MoveAction)
-            super(ListWidget, self).dropEvent(event)
-
-
-class AutowalkGUI(QtWidgets.QMainWindow):
-    """GUI for editing autowalk"""
-
-    def __init__(self, walk):
-        super(QtWidgets.QMainWindow, self).__init__()
-        self.walk = walk
-        self.walk_name_to_element = {element.name: element for element in walk.elements}
-
-        # Create and format GUI window
-        myQWidget = QtWidgets.QWidget()
-        myOuterBoxLayout = QtWidgets.QVBoxLayout()
-        myQWidget.setLayout(myOuterBoxLayout)
-        self.setCentralWidget(myQWidget)
-
-        mediumWidget = QtWidgets.QWidget()
-        myMediumBoxLayout = QtWidgets.QHBoxLayout()
-        mediumWidget.setLayout(myMediumBoxLayout)
-
-        # List widget with available autowalk actions
-        self.sourceLabelWidget = QtWidgets.QLabel(self)
-        self.sourceLabelWidget.setText('Available Actions')
-        self.sourceLabelWidget.setAlignment(QtCore.Qt.AlignCenter)
-        self.sourceListWidget = ListWidget(self)
-
-        self.copyAllButton = QtWidgets.QPushButton('Copy All', self)
-
-        # Populates with current actions from autowalk file
-        for element in walk.elements:
-            QtWidgets.QListWidgetItem(element.name, self.sourceListWidget)
-
-        sourceWidget = QtWidgets.QWidget()
-        sourceBoxLayout = QtWidgets.QVBoxLayout()
-        sourceWidget.setLayout(sourceBoxLayout)
-        sourceBoxLayout.addWidget(self.sourceLabelWidget)
-        sourceBoxLayout.addWidget(self.sourceListWidget)
-        sourceBoxLayout.addWidget(self.copyAllButton)
-
-        myMediumBoxLayout.addWidget(sourceWidget)
-
-        # List widget with modified autowalk
-        self.actionLabelWidget = QtWidgets.QLabel(self)
-        self.actionLabelWidget.setText('Current Autowalk')
-        self.actionLabelWidget.setAlignment(QtCore.Qt.AlignCenter)
-        self.actionListWidget = ListWidget(self, isMutable=True)
-
-        actionWidget = QtWidgets.QWidget()
-        actionBoxLayout = QtWidgets.QVBoxLayout()
-        actionWidget.setLayout(actionBoxLayout)
-        self.deleteButton = QtWidgets.QPushButton('Delete Selected', self)
-        actionBoxLayout.addWidget(self.actionLabelWidget)
-        actionBoxLayout.addWidget(self.actionListWidget)
-        actionBoxLayout.addWidget(self.deleteButton)
-        myMediumBoxLayout.addWidget(actionWidget)
-
-        # Layout for settings
-        self.settingsWidget = QtWidgets.QWidget()
-        self.settingsBoxLayout = QtWidgets.QVBoxLayout()
-        self.settingsWidget.setLayout(self.settingsBoxLayout)
-        self.settingsBoxLayout.setAlignment(QtCore.Qt.AlignTop)
-
-        self.settingsLabelWidget = QtWidgets.QLabel(self)
-        self.settingsLabelWidget.setText('Play Autowalk')
-        self.settingsLabelWidget.setAlignment(QtCore.Qt.AlignCenter)
-        self.repeatsComboBox = QtWidgets.QComboBox(self)
-        self.repeatsComboBox.addItems(['Once', 'Periodically', 'Continuously'])
-        self.skipDockingBox = QtWidgets.QCheckBox('Skip docking')
-        self.intervalLabel = None
-        self.intervalLine = None
-        self.repeatLabel = None
-        self.repeatLine = None
-
-        self.settingsBoxLayout.addWidget(self.settingsLabelWidget)
-        self.settingsBoxLayout.addWidget(self.repeatsComboBox)
-        self.settingsBoxLayout.addWidget(self.skipDockingBox)
-
-        myMediumBoxLayout.addWidget(self.settingsWidget)
-
-        myOuterBoxLayout.addWidget(mediumWidget)
-
-        # Widget for buttons
-        self.applyButton = QtWidgets.QPushButton('Apply', self)
-        self.cancelButton = QtWidgets.QPushButton('Cancel', self)
-        buttonWidget = QtWidgets.QWidget()
-        buttonBoxLayout = QtWidgets.QHBoxLayout()
-        buttonWidget.setLayout(buttonBoxLayout)
-        buttonBoxLayout.addWidget(self.cancelButton)
-        buttonBoxLayout.addWidget(self.applyButton)
-        myOuterBoxLayout.addWidget(buttonWidget)
-
-        # Signal handling
-        self.repeatsComboBox.activated.connect(self.change_play_window)
-        self.copyAllButton.clicked.connect(self.copy_all)
-        self.deleteButton.clicked.connect(self.delete_action)
-        self.applyButton.clicked.connect(self.apply_changes)
-        self.cancelButton.clicked.connect(self.cancel_application)
-
-        self.setWindowTitle('Drag and Drop Autowalk')
-
-    def cancel_application(self):
-        """Clears walk by modifying protocol buffer object"""
-        del self.walk.elements[:]
-        self.close()
-
-    def copy_all(self):
-        """Copies all actions to current autowalk list"""
-        self.actionListWidget.clear()
-        for element in self.walk.elements:
-            QtWidgets.QListWidgetItem(element.name, self.actionListWidget)
-
-    def delete_action(self):
-        """Removes selected action from current autowalk list"""
-        selectedItems = self.actionListWidget.selectedItems()
-        for item in selectedItems:
-            row = self.actionListWidget.row(item)
-            self.actionListWidget.takeItem(row)
-
-    def apply_changes(self):
-        """Modifies walk according to final autowalk list"""
-
-        # Clear current walk's elements
-        del self.walk.elements[:]
-
-        # Maps list of action names to element protocol objects
-        element_names = []
-        for row in range(self.actionListWidget.count()):
-            element_names.append(self.actionListWidget.item(row).text())
-        elements = [self.walk_name_to_element[name] for name in element_names]
-
-        # Sets new elements of walk
-        self.walk.elements.extend(elements)
-
-        # If "once" is selected, check if docking should be skipped
-        if self.repeatsComboBox.currentIndex() == 0:
-            self.walk.playback_mode.once.skip_docking_after_completion = self.skipDockingBox.isChecked(
-            )
-        # If "periodically" is selected, set the interval and repetitions that were input
-        elif self.repeatsComboBox.currentIndex() == 1:
-            intervalInput = int(self.intervalLine.text().strip())
-            repeatInput = int(self.repeatLine.text().strip())
-            self.walk.playback_mode.periodic.interval.seconds = intervalInput
-            self.walk.playback_mode.periodic.repetitions = repeatInput
-        # If "continuous" is selected
-        else:
-            self.walk.playback_mode.continuous.SetInParent()
-
-        self.close()
-
-    def change_play_window(self, index):
-        """Changes the panel for repetitions of autowalk"""
-        # 'Once' is selected
-        if index == 0:
-            # Clears interval GUI options
-            if self.intervalLabel:
-                self.settingsBoxLayout.removeWidget(self.intervalLabel)
-                self.intervalLabel.deleteLater()
-                self.intervalLabel = None
-                self.settingsBoxLayout.removeWidget(self.intervalLine)
-                self.intervalLine.deleteLater()
-                self.intervalLine = None
-                self.settingsBoxLayout.removeWidget(self.repeatLabel)
-                self.repeatLabel.deleteLater()
-                self.repeatLabel = None
-                self.settingsBoxLayout.removeWidget(self.repeatLine)
-                self.repeatLine.deleteLater()
-                self.repeatLine = None
-
-            # Adds docking box to GUI
-            if not self.skipDockingBox:
-                self.skipDockingBox = QtWidgets.QCheckBox('Skip docking')
-                self.settingsBoxLayout.addWidget(self.skipDockingBox)
-
-        # 'Periodically' is selected
-        elif index == 1:
-            # Removes docking box
-            if self.skipDockingBox:
-                self.settingsBoxLayout.removeWidget(self.skipDockingBox)
-                self.skipDockingBox.deleteLater()
-                self.skipDockingBox = None
-
-            # Adds interval and repetition input boxes if needed
-            if not self.intervalLabel:
-                self.intervalLabel = QtWidgets.QLabel(self)
-                self.intervalLabel.setText('Time Interval (s):')
-                self.intervalLine = QtWidgets.QLineEdit()
-                self.repeatLabel = QtWidgets.QLabel(self)
-                self.repeatLabel.setText('Repetitions:')
-                self.repeatLine = QtWidgets.QLineEdit()
-
-                self.settingsBoxLayout.addWidget(self.intervalLabel)
-                self.settingsBoxLayout.addWidget(self.intervalLine)
-                self.settingsBoxLayout.addWidget(self.repeatLabel)
-                self.settingsBoxLayout.addWidget(self.repeatLine)
-
-        # 'Continuously' is selected
-        else:
-            # Removes all other GUI inputs if necessary
-            if self.intervalLabel:
-                self.settingsBoxLayout.removeWidget(self.intervalLabel)
-                self.intervalLabel.deleteLater()
-                self.intervalLabel = None
-                self.settingsBoxLayout.removeWidget(self.intervalLine)
-                self.intervalLine.deleteLater()
-                self.intervalLine = None
-                self.settingsBoxLayout.removeWidget(self.repeatLabel)
-                self.repeatLabel.deleteLater()
-                self.repeatLabel = None
-                self.settingsBoxLayout.removeWidget(self.repeatLine)
-                self.repeatLine.deleteLater()
-                self.repeatLine = None
-            if self.skipDockingBox:
-                self.settingsBoxLayout.removeWidget(self.skipDockingBox)
-                self.skipDockingBox.deleteLater()
-                self.skipDockingBox = None
-
-
 if __name__ == '__main__':
     main()
@@ -6,20 +6,35 @@
 
 """Register and run the Web Cam Service."""
 
+import concurrent.futures
 import logging
 import os
+import threading
 import time
 
 import cv2
 import numpy as np
 from google.protobuf import wrappers_pb2 as wrappers
 
+try:
+    from turbojpeg import (TJPF_BGR, TJPF_BGRA, TJPF_GRAY, TJSAMP_420, TJSAMP_444, TJSAMP_GRAY,
+                           TurboJPEG)
+except ImportError:
+    # PyTurboJPEG is optional. Without it, JPEG images are encoded with OpenCV.
+    TurboJPEG = None
+
+try:
+    from nvjpeg import NvJpeg
+except ImportError:
+    # pynvjpeg is optional. With it, JPEG images are encoded on NVIDIA GPUs, e.g. Jetson payloads.
+    NvJpeg = None
+
 import bosdyn.util
 from bosdyn.api import image_pb2, image_service_pb2_grpc, service_customization_pb2
 from bosdyn.client.directory_registration import (DirectoryRegistrationClient,
                                                   DirectoryRegistrationKeepAlive)
 from bosdyn.client.image_service_helpers import (CameraBaseImageServicer, CameraInterface,
-                                                 VisualImageSource, convert_RGB_to_grayscale)
+                                                 VisualImageSource)
 from bosdyn.client.server_util import GrpcServiceRunner
 from bosdyn.client.util import setup_logging
 
@@ -30,13 +45,34 @@ SERVICE_TYPE = 'bosdyn.api.ImageService'
 _LOGGER = logging.getLogger(__name__)
 CONTRAST_MIN = 0
 CONTRAST_MAX = 255
+# Interpolations that can be used to resize images, mapped to their OpenCV flags. Area
+# interpolation gives the best quality when shrinking images, while linear interpolation is faster
+# for services that prioritize latency.
+INTERPOLATION_OPTIONS = {'area': cv2.INTER_AREA, 'linear': cv2.INTER_LINEAR}
+DEFAULT_INTERPOLATION = 'area'
+# JPEGs at or above this quality keep full resolution colour (4:4:4 chroma subsampling) and, with
+# OpenCV, optimized Huffman tables. Lower qualities use 4:2:0, which is faster and smaller.
+HIGH_JPEG_QUALITY = 80
+# With adaptive JPEG quality, requests without a quality are encoded at a quality that rises from
+# the minimum by the gain for each grey level of average difference between consecutive frames,
+# measured on thumbnails of the given size and smoothed with the given weight for new frames.
+MIN_ADAPTIVE_JPEG_QUALITY = 55
+MAX_ADAPTIVE_JPEG_QUALITY = 90
+ADAPTIVE_JPEG_QUALITY_GAIN = 2.5
+MOTION_THUMBNAIL_SIZE = (64, 36)
+MOTION_SMOOTHING = 0.2
+
+# Requests for different images are already processed in parallel by the gRPC thread pool, so keep
+# OpenCV from also splitting each resize and color conversion across every core.
+cv2.setNumThreads(1)
 
 
 class WebCam(CameraInterface):
     """Provide access to the latest web cam data using openCV's VideoCapture."""
 
     def __init__(self, device_name, fps=30, show_debug_information=False, codec='', res_width=-1,
-                 res_height=-1):
+                 res_height=-1, jpeg_passthrough=False, adaptive_jpeg_quality=False,
+                 resize_interpolation=DEFAULT_INTERPOLATION):
         super(WebCam, self).__init__()
         self.show_debug_images = show_debug_information
 
@@ -59,8 +95,14 @@ class WebCam(CameraInterface):
         # Create the image source name from the device name.
         self.image_source_name = device_name_to_source_name(device_name)
 
-        # OpenCV VideoCapture instance.
-        self.capture = cv2.VideoCapture(device_name)
+        # OpenCV VideoCapture instance. With JPEG passthrough, OpenCV returns the camera's MJPEG
+        # frames without decoding them, which is only supported by the V4L2 backend.
+        self.jpeg_passthrough = jpeg_passthrough
+        if jpeg_passthrough:
+            codec = 'MJPG'
+            self.capture = cv2.VideoCapture(device_name, cv2.CAP_V4L2)
+        else:
+            self.capture = cv2.VideoCapture(device_name)
         if not self.capture.isOpened():
             # Unable to open a video capture connection to the specified device.
             err = f'Unable to open a cv2.VideoCapture connection to {device_name}'
@@ -68,6 +110,9 @@ class WebCam(CameraInterface):
             raise Exception(err)
 
         self.capture.set(cv2.CAP_PROP_FPS, fps)
+        # CameraBaseImageServicer already captures in a background thread and serves requests the
+        # latest frame. Keep the driver from queueing frames behind it, so each grab is the newest.
+        self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         if res_width > 0 and res_height > 0:
             self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, res_width)
             self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, res_height)
@@ -86,6 +131,8 @@ class WebCam(CameraInterface):
             raise Exception(
                 f'The codec argument provided ({codec}) is the incorrect format. It should be a four character string.'
             )
+        if jpeg_passthrough and not self.capture.set(cv2.CAP_PROP_CONVERT_RGB, 0):
+            raise Exception(f'Unable to capture undecoded MJPEG frames from {device_name}')
 
         # Attempt to determine the gain and exposure for the camera.
         self.camera_exposure, self.camera_gain = None, None
@@ -105,23 +152,72 @@ class WebCam(CameraInterface):
         self.cols = int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH))
 
         self.default_jpeg_quality = 75
+        self.resize_interpolation = INTERPOLATION_OPTIONS[resize_interpolation]
+        # Passed through JPEG frames are not decoded, so their motion cannot be measured.
+        self.adaptive_jpeg_quality = adaptive_jpeg_quality and not jpeg_passthrough
+        self.motion_score = 0.0
+        self.last_thumbnail = None
         self.default_contrast = self.capture.get(cv2.CAP_PROP_CONTRAST)
+        # Contrast last applied to the camera, so it is only set again when it changes.
+        self.current_contrast = self.default_contrast
+
+        # Encode JPEGs with libjpeg-turbo when it is available, since it reads the BGR(A) frames
+        # from OpenCV directly and can convert them to greyscale as part of the encode.
+        self.turbo_jpeg = None
+        if TurboJPEG is not None:
+            try:
+                self.turbo_jpeg = TurboJPEG()
+            except (OSError, RuntimeError) as err:
+                _LOGGER.warning('Unable to load libjpeg-turbo, using OpenCV to encode JPEGs: %s',
+                                err)
+
+        # Encode colour JPEGs on the GPU when nvJPEG is available. Encodes are serialized, since
+        # they share one nvJPEG handle.
+        self.nvjpeg = None
+        self.nvjpeg_lock = threading.Lock()
+        if NvJpeg is not None:
+            try:
+                self.nvjpeg = NvJpeg()
+            except Exception as err:
+                _LOGGER.warning('Unable to initialize nvJPEG, encoding JPEGs on the CPU: %s', err)
 
         # Determine the pixel format.
+        self.channels = None
+        self.greyscale_conversion = None
+        self.default_pixel_format = image_pb2.Image.PIXEL_FORMAT_UNKNOWN
         self.supported_pixel_formats = []
         success, image = self.capture.read()
         if success:
-            if image.shape[2] == 1:
-                self.supported_pixel_formats = [image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8]
-            elif image.shape[2] == 3:
-                self.supported_pixel_formats = [
-                    image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8, image_pb2.Image.PIXEL_FORMAT_RGB_U8
-                ]
-            elif image.shape[2] == 4:
-                self.supported_pixel_formats = [
-                    image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8, image_pb2.Image.PIXEL_FORMAT_RGB_U8,
-                    image_pb2.Image.PIXEL_FORMAT_RGBA_U8
-                ]
+            self.set_channels(self.decode_frame(image).shape[2])
+
+    def set_channels(self, channels):
+        """Cache the pixel layout of the camera's frames, which does not change between captures."""
+        self.channels = channels
+        # OpenCV color conversion code to produce a greyscale image, if one is needed.
+        self.greyscale_conversion = {3: cv2.COLOR_BGR2GRAY, 4: cv2.COLOR_BGRA2GRAY}.get(channels)
+        # Pixel format of the images when greyscale is not requested.
+        self.default_pixel_format = {
+            1: image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8,
+            3: image_pb2.Image.PIXEL_FORMAT_RGB_U8,
+            4: image_pb2.Image.PIXEL_FORMAT_RGBA_U8
+        }.get(channels, image_pb2.Image.PIXEL_FORMAT_UNKNOWN)
+        if channels == 1:
+            self.supported_pixel_formats = [image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8]
+        elif channels == 3:
+            self.supported_pixel_formats = [
+                image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8, image_pb2.Image.PIXEL_FORMAT_RGB_U8
+            ]
+        elif channels == 4:
+            self.supported_pixel_formats = [
+                image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8, image_pb2.Image.PIXEL_FORMAT_RGB_U8,
+                image_pb2.Image.PIXEL_FORMAT_RGBA_U8
+            ]
+
+    def decode_frame(self, image_data):
+        """Returns a captured frame as an OpenCV image, decoding it if it is an MJPEG frame."""
+        if self.jpeg_passthrough:
+            return cv2.imdecode(image_data, cv2.IMREAD_COLOR)
+        return image_data
 
     def blocking_capture(self, *, custom_params=None, **kwargs):
         contrast = self.default_contrast
@@ -133,14 +229,23 @@ class WebCam(CameraInterface):
         # Lock mutex, set capture contrast, get image, then release mutex.
         # This ensures the appropriate contrast is applied to the image.
         with self.capture_lock:
-            self.capture.set(cv2.CAP_PROP_CONTRAST, contrast)
+            if contrast != self.current_contrast:
+                self.capture.set(cv2.CAP_PROP_CONTRAST, contrast)
+                self.current_contrast = contrast
+            image = None
+            success = self.capture.grab()
+            # Timestamp the frame once it is grabbed, before it is decoded. This must be the
+            # wall-clock time, since the servicer converts it to robot time using time sync.
             capture_time = time.time()
-            success, image = self.capture.read()
+            if success:
+                success, image = self.capture.retrieve()
+            if success and self.adaptive_jpeg_quality:
+                self.update_motion_score(image)
 
         if self.show_debug_images:
             _LOGGER.info('Image Capture Result: %s', str(success))
             try:
-                cv2.imshow('WebCam Image Capture', image)
+                cv2.imshow('WebCam Image Capture', self.decode_frame(image))
                 cv2.waitKey(1)
             except Exception:
                 _LOGGER.warning('Unable to display the webcam image captured.')
@@ -150,72 +255,147 @@ class WebCam(CameraInterface):
         else:
             raise Exception('Unsuccessful call to cv2.VideoCapture().read()')
 
+    def update_motion_score(self, image):
+        """Update the moving average of the difference between consecutive frames."""
+        thumbnail = cv2.resize(image, MOTION_THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+        if self.last_thumbnail is not None:
+            difference = cv2.absdiff(thumbnail, self.last_thumbnail).mean()
+            self.motion_score += MOTION_SMOOTHING * (difference - self.motion_score)
+        self.last_thumbnail = thumbnail
+
     def image_decode(self, image_data, image_proto, image_req):
         pixel_format = image_req.pixel_format
         image_format = image_req.image_format
 
+        encode_jpeg = (image_format == image_pb2.Image.FORMAT_JPEG or
+                       image_format == image_pb2.Image.FORMAT_UNKNOWN or image_format is None)
+        # libjpeg-turbo converts colour images to greyscale while encoding them.
+        greyscale_in_encoder = encode_jpeg and self.turbo_jpeg is not None
+        resize_ratio = image_req.resize_ratio
+        quality_percent = image_req.quality_percent
+
+        if self.jpeg_passthrough:
+            # Return the camera's JPEG frame as it is, instead of decoding and re-encoding it, unless
+            # the image has to be resized or converted. The camera determines the JPEG quality.
+            if (encode_jpeg and resize_ratio in (0, 1) and self.channels is not None and
+                    pixel_format != image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8):
+                image_proto.pixel_format = self.default_pixel_format
+                image_proto.data = image_data.tobytes()
+                image_proto.format = image_pb2.Image.FORMAT_JPEG
+                return
+            image_data = self.decode_frame(image_data)
+
         converted_image_data = image_data
+        if self.channels is None:
+            # No frame could be read when the camera was opened.
+            self.set_channels(image_data.shape[2])
         # Determine the pixel format for the data.
-        if converted_image_data.shape[2] == 3:
-            # RGB image.
-            if pixel_format == image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8:
-                converted_image_data = convert_RGB_to_grayscale(
-                    cv2.cvtColor(converted_image_data, cv2.COLOR_BGR2RGB))
-                image_proto.pixel_format = pixel_format
-            else:
-                image_proto.pixel_format = image_pb2.Image.PIXEL_FORMAT_RGB_U8
-        elif converted_image_data.shape[2] == 1:
-            # Greyscale image.
-            image_proto.pixel_format = image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8
-        elif converted_image_data.shape[2] == 4:
-            # RGBA image.
-            if pixel_format == image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8:
-                converted_image_data = convert_RGB_to_grayscale(
-                    cv2.cvtColor(converted_image_data, cv2.COLOR_BGRA2RGB))
-                image_proto.pixel_format = pixel_format
-            else:
-                image_proto.pixel_format = image_pb2.Image.PIXEL_FORMAT_RGBA_U8
+        if (pixel_format == image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8 and
+                self.greyscale_conversion is not None):
+            # RGB or RGBA image.
+            if not greyscale_in_encoder:
+                converted_image_data = cv2.cvtColor(converted_image_data, self.greyscale_conversion)
+            image_proto.pixel_format = pixel_format
         else:
-            # The number of pixel channels did not match any of the known formats.
-            image_proto.pixel_format = image_pb2.Image.PIXEL_FORMAT_UNKNOWN
+            # Greyscale images, colour images when greyscale is not requested, and images whose
+            # number of pixel channels did not match any of the known formats.
+            image_proto.pixel_format = self.default_pixel_format
 
         # Note, we are currently not setting any information for the transform snapshot or the frame
         # name for an image sensor since this information can't be determined with openCV.
 
-        resize_ratio = image_req.resize_ratio
-        quality_percent = image_req.quality_percent
-
         if resize_ratio < 0 or resize_ratio > 1:
             raise ValueError(f'Resize ratio {resize_ratio} is out of bounds.')
 
-        if resize_ratio != 1.0 and resize_ratio != 0:
-            image_proto.rows = int(image_proto.rows * resize_ratio)
-            image_proto.cols = int(image_proto.cols * resize_ratio)
-            converted_image_data = cv2.resize(converted_image_data,
-                                              (image_proto.cols, image_proto.rows),
-                                              interpolation=cv2.INTER_AREA)
+        if resize_ratio not in (0, 1):
+            new_rows = int(image_proto.rows * resize_ratio)
+            new_cols = int(image_proto.cols * resize_ratio)
+            image_proto.rows = new_rows
+            image_proto.cols = new_cols
+            converted_image_data = cv2.resize(converted_image_data, (new_cols, new_rows),
+                                              interpolation=self.resize_interpolation)
 
         # Set the image data.
         if image_format == image_pb2.Image.FORMAT_RAW:
             image_proto.data = np.ndarray.tobytes(converted_image_data)
             image_proto.format = image_pb2.Image.FORMAT_RAW
-        elif image_format == image_pb2.Image.FORMAT_JPEG or image_format == image_pb2.Image.FORMAT_UNKNOWN or image_format is None:
+        elif encode_jpeg:
             # If the image format is requested as JPEG or if no specific image format is requested, return
             # a JPEG. Since this service is for a webcam, we choose a sane default for the return if the
             # request format is unpopulated.
             quality = self.default_jpeg_quality
+            if self.adaptive_jpeg_quality:
+                # Moving scenes need a higher quality than static ones to look the same.
+                quality = min(
+                    MAX_ADAPTIVE_JPEG_QUALITY,
+                    MIN_ADAPTIVE_JPEG_QUALITY + ADAPTIVE_JPEG_QUALITY_GAIN * self.motion_score)
             if quality_percent > 0 and quality_percent <= 100:
                 # A valid image quality percentage was passed with the image request,
                 # so use this value instead of the service's default.
                 quality = quality_percent
-            encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), int(quality)]
-            image_proto.data = cv2.imencode('.jpg', converted_image_data, encode_param)[1].tobytes()
+            image_proto.data = self.jpeg_encode(
+                converted_image_data, int(quality),
+                image_proto.pixel_format == image_pb2.Image.PIXEL_FORMAT_GREYSCALE_U8)
             image_proto.format = image_pb2.Image.FORMAT_JPEG
         else:
             # Unsupported format.
             raise Exception(
                 f'Image format {image_pb2.Image.Format.Name(image_format)} is unsupported.')
 
+    def jpeg_encode(self, image_data, quality, greyscale):
+        """Encode an OpenCV image as a JPEG, with nvJPEG or libjpeg-turbo if they are available.
+
+        nvJPEG always uses 4:2:0 chroma subsampling, so it only encodes colour images below
+        HIGH_JPEG_QUALITY. Higher qualities are encoded on the CPU with 4:4:4 subsampling.
+
+        Args:
+            image_data (numpy array): Greyscale, BGR or BGRA image data.
+            quality (int): JPEG quality, from 1 to 100.
+            greyscale (bool): Encode a single channel JPEG, even if the image data is in colour.
+                Only used with libjpeg-turbo; otherwise the image data must already be greyscale.
+        Returns:
+            The JPEG encoded image as bytes.
+        """
+        if (self.nvjpeg is not None and quality < HIGH_JPEG_QUALITY and not greyscale and
+                image_data.ndim == 3 and image_data.shape[2] == 3):
+            with self.nvjpeg_lock:
+                return self.nvjpeg.encode(image_data, quality)
+        if self.turbo_jpeg is not None:
+            return self.turbo_jpeg_encode(image_data, quality, greyscale)
+        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
+        if quality >= HIGH_JPEG_QUALITY:
+            encode_param += [int(cv2.IMWRITE_JPEG_OPTIMIZE), 1]
+        # The sampling factor option was added in OpenCV 4.5.5.
+        if hasattr(cv2, 'IMWRITE_JPEG_SAMPLING_FACTOR'):
+            sampling_factor = (cv2.IMWRITE_JPEG_SAMPLING_FACTOR_444 if quality >= HIGH_JPEG_QUALITY
+                               else cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420)
+            encode_param += [int(cv2.IMWRITE_JPEG_SAMPLING_FACTOR), sampling_factor]
+        return cv2.imencode('.jpg', image_data, encode_param)[1].tobytes()
+
+    def turbo_jpeg_encode(self, image_data, quality, greyscale):
+        """Encode an OpenCV image as a JPEG with libjpeg-turbo.
+
+        Args:
+            image_data (numpy array): Greyscale, BGR or BGRA image data.
+            quality (int): JPEG quality, from 1 to 100.
+            greyscale (bool): Encode a single channel JPEG, even if the image data is in colour.
+        Returns:
+            The JPEG encoded image as bytes.
+        """
+        channels = 1 if image_data.ndim == 2 else image_data.shape[2]
+        if channels == 1:
+            return self.turbo_jpeg.encode(image_data, quality=quality, pixel_format=TJPF_GRAY,
+                                          jpeg_subsample=TJSAMP_GRAY)
+        pixel_format = TJPF_BGRA if channels == 4 else TJPF_BGR
+        if greyscale:
+            jpeg_subsample = TJSAMP_GRAY
+        elif quality >= HIGH_JPEG_QUALITY:
+            jpeg_subsample = TJSAMP_444
+        else:
+            jpeg_subsample = TJSAMP_420
+        return self.turbo_jpeg.encode(image_data, quality=quality, pixel_format=pixel_format,
+                                      jpeg_subsample=jpeg_subsample)
+
 
 def device_name_to_source_name(device_name):
     if isinstance(device_name, int):
@@ -236,12 +416,21 @@ def create_dict_param_child_spec(default_val, min_val, max_val, display_name):
 
 def make_webcam_image_service(bosdyn_sdk_robot, service_name, device_names,
                               show_debug_information=False, logger=None, codec='', res_width=-1,
-                              res_height=-1):
-    image_sources = []
-    for device in device_names:
-        web_cam = WebCam(device, show_debug_information=show_debug_information, codec=codec,
-                         res_width=res_width, res_height=res_height)
+                              res_height=-1, jpeg_passthrough=False, adaptive_jpeg_quality=False,
+                              resize_interpolation=DEFAULT_INTERPOLATION):
+
+    def open_web_cam(device):
+        return WebCam(device, show_debug_information=show_debug_information, codec=codec,
+                      res_width=res_width, res_height=res_height, jpeg_passthrough=jpeg_passthrough,
+                      adaptive_jpeg_quality=adaptive_jpeg_quality,
+                      resize_interpolation=resize_interpolation)
 
+    # Open the cameras in parallel, since probing each device can take a while.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(device_names))) as executor:
+        web_cams = list(executor.map(open_web_cam, device_names))
+
+    image_sources = []
+    for web_cam in web_cams:
         # Define contrast custom parameter for the image source.
         param_spec = service_customization_pb2.DictParam.Spec()
         param_spec.specs.get_or_create("Contrast").CopyFrom(
@@ -262,15 +451,21 @@ def make_webcam_image_service(bosdyn_sdk_robot, service_name, device_names,
 
 
 def run_service(bosdyn_sdk_robot, port, service_name, device_names, show_debug_information=False,
-                logger=None, codec='', res_width=-1, res_height=-1):
+                logger=None, codec='', res_width=-1, res_height=-1, jpeg_passthrough=False,
+                adaptive_jpeg_quality=False, resize_interpolation=DEFAULT_INTERPOLATION):
     # Proto service specific function used to attach a servicer to a server.
     add_servicer_to_server_fn = image_service_pb2_grpc.add_ImageServiceServicer_to_server
 
     # Instance of the servicer to be run.
-    service_servicer = make_webcam_image_service(bosdyn_sdk_robot, service_name, device_names,
-                                                 show_debug_information, logger=logger, codec=codec,
-                                                 res_width=res_width, res_height=res_height)
-    return GrpcServiceRunner(service_servicer, add_servicer_to_server_fn, port, logger=logger)
+    service_servicer = make_webcam_image_service(
+        bosdyn_sdk_robot, service_name, device_names, show_debug_information, logger=logger,
+        codec=codec, res_width=res_width, res_height=res_height, jpeg_passthrough=jpeg_passthrough,
+        adaptive_jpeg_quality=adaptive_jpeg_quality, resize_interpolation=resize_interpolation)
+    # GrpcServiceRunner's default 100 MB message limits fit any frame, but its default of 4 workers
+    # would queue requests once several cameras are being streamed, so scale it with the cameras.
+    max_workers = max(4, 2 * len(device_names))
+    return GrpcServiceRunner(service_servicer, add_servicer_to_server_fn, port,
+                             max_workers=max_workers, logger=logger)
 
 
 def add_web_cam_arguments(parser):
@@ -288,6 +483,19 @@ def add_web_cam_arguments(parser):
                         help='Resolution width (pixels).')
     parser.add_argument('--res-height', required=False, type=int, default=-1,
                         help='Resolution height (pixels).')
+    parser.add_argument(
+        '--jpeg-passthrough', action='store_true', required=False,
+        help='If passed, capture MJPEG frames with V4L2 (linux only) and return them without '
+        're-encoding for JPEG requests that are not resized or greyscale.')
+    parser.add_argument(
+        '--adaptive-jpeg-quality', action='store_true', required=False,
+        help='If passed, JPEG requests without a quality use a lower quality for static scenes and '
+        'a higher quality when there is motion, instead of a fixed quality of 75.')
+    parser.add_argument(
+        '--resize-interpolation', choices=sorted(INTERPOLATION_OPTIONS),
+        default=DEFAULT_INTERPOLATION, required=False,
+        help='Interpolation used to resize images. "area" gives the best quality, while "linear" '
+        'resizes faster.')
 
 
 def add_common_arguments(parser):
@@ -339,7 +547,10 @@ def main():
     # Create a service runner to start and maintain the service on background thread.
     service_runner = run_service(robot, options.port, DIRECTORY_NAME, devices,
                                  options.show_debug_info, logger=_LOGGER, codec=options.codec,
-                                 res_width=options.res_width, res_height=options.res_height)
+                                 res_width=options.res_width, res_height=options.res_height,
+                                 jpeg_passthrough=options.jpeg_passthrough,
+                                 adaptive_jpeg_quality=options.adaptive_jpeg_quality,
+                                 resize_interpolation=options.resize_interpolation)
 
     # Use a keep alive to register the service with the robot directory.
     dir_reg_client = robot.ensure_client(DirectoryRegistrationClient.default_service_name)